@@ -15,6 +15,7 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 from strands import Agent
 from bedrock_agentcore import BedrockAgentCoreApp
 from bedrock_agentcore.memory import MemoryClient
@@ -417,19 +418,35 @@ def create_agent(session_id: str, repository: str) -> Agent:
     return agent
 
 
+def _validate_payload(payload: dict) -> Optional[str]:
+    """Cheaply check the webhook payload, returning an error message or None"""
+    if not isinstance(payload, dict):
+        return "Invalid GitHub webhook payload: expected a JSON object"
+    
+    pr = payload.get('pull_request')
+    repo = payload.get('repository')
+    head = pr.get('head') if isinstance(pr, dict) else None
+    if not (isinstance(repo, dict) and isinstance(head, dict)
+            and pr.get('number') and repo.get('full_name')
+            and head.get('sha') and head.get('ref')):
+        return "Missing required PR information in webhook payload"
+    return None
+
+
 def parse_github_webhook(payload: dict) -> dict:
     """Parse GitHub webhook payload to extract PR context"""
     try:
         action = payload.get('action')
         pr = payload.get('pull_request', {})
         repo = payload.get('repository', {})
+        head = pr.get('head', {})
         
         return {
             'action': action,
             'pr_number': pr.get('number'),
             'repository_name': repo.get('full_name'),
-            'commit_sha': pr.get('head', {}).get('sha'),
-            'branch_name': pr.get('head', {}).get('ref'),
+            'commit_sha': head.get('sha'),
+            'branch_name': head.get('ref'),
             'base_branch': pr.get('base', {}).get('ref'),
             'title': pr.get('title', ''),
             'clone_url': repo.get('clone_url'),
@@ -483,11 +500,23 @@ def invoke(payload: dict) -> dict:
     start_time = time.time()
     logger.info("Eco-Coder agent invoked, start of the entrypoint")
     
+    # Reject malformed webhooks before any agent, session or client work
+    validation_error = _validate_payload(payload)
+    if validation_error:
+        logger.error(f"Rejecting webhook payload: {validation_error}")
+        return {
+            "status": "error",
+            "message": validation_error,
+            "session_id": "unknown",
+            "execution_time_seconds": round(time.time() - start_time, 2)
+        }
+    
     try:
         # Store payload globally for tool access
         current_payload = payload
         
-        logger.info(f"Received payload: {json.dumps(payload, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received payload: %s", json.dumps(payload, indent=2))
         
         # Check if agent was initialized properly
         if agent is None:
@@ -500,14 +529,9 @@ def invoke(payload: dict) -> dict:
                 "execution_time_seconds": round(time.time() - start_time, 3)
             }
         
-        # Parse GitHub webhook payload
+        # Parse GitHub webhook payload (required fields were checked above)
         pr_info = parse_github_webhook(payload)
         
-        # Validate required fields
-        if not all([pr_info.get('pr_number'), pr_info.get('repository_name'), 
-                   pr_info.get('commit_sha'), pr_info.get('branch_name')]):
-            raise ValueError("Missing required PR information in webhook payload")
-        
         # Generate unique session ID
         session_id = f"pr-{pr_info['repository_name']}-{pr_info['pr_number']}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
         
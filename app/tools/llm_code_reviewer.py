@@ -19,8 +19,10 @@ Author: EcoCoder Agent
 Version: 1.0.0 (LLM-Powered Code Review)
 """
 
+import hashlib
 import logging
 import json
+import os
 import re
 import time
 from typing import Dict, Any, List, Optional, Tuple
@@ -42,6 +44,11 @@ CHUNK_SIZE = 50000  # 50KB chunks for large diffs
 DEFAULT_MODEL = "amazon.titan-text-express-v1"  # Amazon Titan Text Express
 FALLBACK_MODEL = "amazon.titan-text-lite-v1"  # Amazon Titan Text Lite (faster fallback)
 
+# Optional on-disk cache for PR diffs and LLM responses. Diffs are keyed by
+# (repo full_name, head sha) and LLM responses by a hash of model + prompt;
+# both inputs are immutable, so entries never need invalidating.
+REVIEW_CACHE_DIR = os.getenv('ECOCODER_REVIEW_CACHE_DIR')
+
 # Code review focus areas
 REVIEW_CATEGORIES = {
     "security": {
@@ -81,6 +88,41 @@ class LLMCodeReviewError(Exception):
     pass
 
 
+def _review_cache_path(kind: str, key: str) -> Optional[str]:
+    """Return the cache file path for a key, or None when caching is disabled"""
+    if not REVIEW_CACHE_DIR:
+        return None
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return os.path.join(REVIEW_CACHE_DIR, f"{kind}-{digest}.txt")
+
+
+def _review_cache_get(kind: str, key: str) -> Optional[str]:
+    """Read a cached entry, returning None on a miss"""
+    path = _review_cache_path(kind, key)
+    if not path:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _review_cache_set(kind: str, key: str, content: str) -> None:
+    """Store an entry; cache write failures are logged and otherwise ignored"""
+    path = _review_cache_path(kind, key)
+    if not path:
+        return
+    try:
+        os.makedirs(REVIEW_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write review cache entry: {e}")
+
+
 class DiffFetcher:
     """Handles fetching and parsing PR diffs from GitHub"""
     
@@ -469,6 +511,12 @@ Provide analysis in JSON format focusing on the most critical issues in this fil
     
     def _call_bedrock_llm(self, prompt: str, model_id: str) -> str:
         """Call AWS Bedrock LLM with the analysis prompt"""
+        cache_key = f"{model_id}\n{prompt}"
+        cached_response = _review_cache_get('llm', cache_key)
+        if cached_response is not None:
+            logger.info(f"Using cached {model_id} response")
+            return cached_response
+        
         try:
             # Prepare request for different model types
             if "claude" in model_id:
@@ -513,11 +561,12 @@ Provide analysis in JSON format focusing on the most critical issues in this fil
             response_body = json.loads(response['body'].read())
             
             if "claude" in model_id:
-                return response_body['content'][0]['text']
-            elif "titan" in model_id:
-                return response_body['results'][0]['outputText']
+                response_text = response_body['content'][0]['text']
             else:
-                return response_body['results'][0]['outputText']
+                response_text = response_body['results'][0]['outputText']
+            
+            _review_cache_set('llm', cache_key, response_text)
+            return response_text
                 
         except Exception as e:
             logger.error(f"Bedrock LLM call failed: {e}")
@@ -757,9 +806,22 @@ def analyze_code_quality_with_llm(
                 'analysis_time_seconds': round(time.time() - start_time, 3)
             }
         
-        # Fetch and parse PR diff
+        # Fetch and parse PR diff; a given head sha always has the same diff
+        diff_cache_key = None
+        if pr_payload:
+            repo_full_name = pr_payload.get('repository', {}).get('full_name')
+            head_sha = pr_payload.get('pull_request', {}).get('head', {}).get('sha')
+            if repo_full_name and head_sha:
+                diff_cache_key = f"{repo_full_name}@{head_sha}"
+        
         diff_fetcher = DiffFetcher(github_token)
-        diff_content = diff_fetcher.fetch_pr_diff(diff_url)
+        diff_content = _review_cache_get('diff', diff_cache_key) if diff_cache_key else None
+        if diff_content is not None:
+            logger.info(f"Using cached diff for {diff_cache_key}")
+        else:
+            diff_content = diff_fetcher.fetch_pr_diff(diff_url)
+            if diff_cache_key:
+                _review_cache_set('diff', diff_cache_key, diff_content)
         parsed_diff = diff_fetcher.parse_diff(diff_content)
         
         logger.info(f"Parsed diff: {parsed_diff['total_files']} files, "
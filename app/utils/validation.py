@@ -15,6 +15,26 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Dangerous HTML tags stripped from markdown before posting to GitHub.
+# The probe is a cheap first-hit search; the full substitution only runs
+# when the probe finds something.
+_DANGEROUS_TAG_PROBE = re.compile(r'<(?:script|iframe|object|embed|link)', re.IGNORECASE)
+_DANGEROUS_TAG_RE = re.compile(
+    r'<(?:script|iframe|object|embed|link)[^>]*>.*?</?\w+>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Required runtime environment, read once at import. Lambda and AgentCore
+# containers do not change their environment between warm invocations.
+_REQUIRED_ENV_VARS = ('AWS_REGION', 'GITHUB_TOKEN_SECRET_NAME', 'WEBHOOK_SECRET_NAME')
+_ENV_CACHE = {var: os.environ.get(var) for var in _REQUIRED_ENV_VARS}
+_MISSING_ENV_VARS = [var for var, value in _ENV_CACHE.items() if not value]
+
+# Fast-path URL validation for plain http(s) URLs; anything else
+# (userinfo escapes, IPv6 literals, other schemes) goes through urlparse.
+_FAST_URL_SCHEMES = frozenset(('http', 'https'))
+_URL_NETLOC_UNSAFE = re.compile(r'[^A-Za-z0-9.\-:_@]')
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -126,6 +146,30 @@ class Validator:
         if allowed_schemes is None:
             allowed_schemes = ['http', 'https']
             
+        # Fast path: "http(s)://host..." decided with plain string scans
+        sep = url.find('://')
+        if 0 < sep <= 10 and url[:sep] in _FAST_URL_SCHEMES:
+            scheme = url[:sep]
+            host_start = sep + 3
+            host_end = len(url)
+            for delimiter in '/?#':
+                idx = url.find(delimiter, host_start)
+                if idx != -1 and idx < host_end:
+                    host_end = idx
+            netloc = url[host_start:host_end]
+            
+            if not _URL_NETLOC_UNSAFE.search(netloc):
+                if scheme not in allowed_schemes:
+                    raise ValidationError(
+                        f"Invalid URL format: {url} - Invalid URL scheme: {scheme}. "
+                        f"Allowed: {allowed_schemes}"
+                    )
+                if not netloc:
+                    raise ValidationError(
+                        f"Invalid URL format: {url} - URL missing domain: {url}"
+                    )
+                return url
+            
         try:
             parsed = urlparse(url)
             
@@ -269,16 +313,10 @@ class Validator:
             content = content[:max_length - 100] + "\n\n... (truncated)"
             
         # Basic sanitization - remove dangerous HTML
-        dangerous_tags = ['<script', '<iframe', '<object', '<embed', '<link']
-        for tag in dangerous_tags:
-            if tag.lower() in content.lower():
-                logger.warning(f"Removed dangerous HTML tag: {tag}")
-                content = re.sub(
-                    rf'{re.escape(tag)}[^>]*>.*?</?\w+>', 
-                    '[REMOVED]', 
-                    content, 
-                    flags=re.IGNORECASE | re.DOTALL
-                )
+        match = _DANGEROUS_TAG_PROBE.search(content)
+        if match:
+            logger.warning(f"Removed dangerous HTML tag: {match.group(0).lower()}")
+            content = _DANGEROUS_TAG_RE.sub('[REMOVED]', content)
                 
         return content
     
@@ -386,27 +424,15 @@ class ConfigValidator:
         """
         Validate runtime environment variables.
         
+        Values are read once at module import; warm invocations reuse them.
+        
         Returns:
             Dictionary of validated environment variables
         """
-        required_env_vars = [
-            'AWS_REGION',
-            'GITHUB_TOKEN_SECRET_NAME',
-            'WEBHOOK_SECRET_NAME'
-        ]
-        
-        env_vars = {}
-        missing_vars = []
+        env_vars = {var: value for var, value in _ENV_CACHE.items() if value}
         
-        for var in required_env_vars:
-            value = os.getenv(var)
-            if not value:
-                missing_vars.append(var)
-            else:
-                env_vars[var] = value
-                
-        if missing_vars:
-            logger.warning(f"Missing environment variables: {missing_vars}")
+        if _MISSING_ENV_VARS:
+            logger.warning(f"Missing environment variables: {_MISSING_ENV_VARS}")
             # In production, this might be an error
             # For development, we'll allow it with mock mode
             
@@ -68,6 +68,21 @@ else
     exit 1
 fi
 
+# Report the function bundle size - cold start time grows with package size
+BUNDLE_DIR=".aws-sam/build/EcoCoderCoreEntryFunction"
+if [ -d "$BUNDLE_DIR" ]; then
+    print_info "Function bundle size: $(du -sh "$BUNDLE_DIR" | cut -f1)"
+    
+    # The bridge needs the bedrock-agentcore client; fail before deploying a
+    # bundle whose botocore does not have it
+    if PYTHONPATH="$BUNDLE_DIR" python3 -c "import boto3, sys; sys.exit('bedrock-agentcore' not in boto3.session.Session().get_available_services())"; then
+        print_success "Bundled boto3 includes the bedrock-agentcore client"
+    else
+        print_error "Bundled boto3 has no bedrock-agentcore client - bump boto3/botocore in requirements.txt"
+        exit 1
+    fi
+fi
+
 # Deploy based on environment
 case $ENVIRONMENT in
     "dev")
@@ -8,14 +8,27 @@ to the deployed EcoCoder agent in Bedrock AgentCore Runtime.
 """
 
 import json
-import boto3
-import uuid
 import hmac
-import hashlib
 import os
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Union
+
+# Prefer orjson for webhook parsing and response bodies; fall back to stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    _dumps_bytes = orjson.dumps
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 
 # Configure logging
 logger = logging.getLogger()
@@ -25,14 +38,117 @@ logger.setLevel(logging.INFO)
 AGENT_ARN = os.environ.get('AGENT_ARN', 'arn:aws:bedrock-agentcore:ap-southeast-1:434114167546:runtime/ecocoderagentcore-H0kpdY5A85')
 GITHUB_SECRET = os.environ.get('GITHUB_WEBHOOK_SECRET', '')  # Optional for hackathon
 REGION = os.environ.get('ECOCODER_REGION', os.environ.get('AWS_REGION', 'ap-southeast-1'))
+# The AgentCore invocation runs in this same function (async self-invoke)
+WORKER_FUNCTION_NAME = os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+# Alias the worker is invoked through (set by the template to the SnapStart alias);
+# empty means the unqualified function, e.g. under sam local
+WORKER_FUNCTION_ALIAS = os.environ.get('ECOCODER_FUNCTION_ALIAS', '')
+_GITHUB_SECRET_KEY = GITHUB_SECRET.encode('utf-8')
+
+# Constant invoke_agent_runtime arguments; only the session and payload vary
+_STATIC_INVOKE_KW = {'agentRuntimeArn': AGENT_ARN, 'qualifier': 'DEFAULT'}
+
+# Constant Lambda invoke arguments for the async worker hand-off
+_WORKER_INVOKE_KW = {'FunctionName': WORKER_FUNCTION_NAME, 'InvocationType': 'Event'}
+if WORKER_FUNCTION_ALIAS:
+    _WORKER_INVOKE_KW['Qualifier'] = WORKER_FUNCTION_ALIAS
 
-# Initialize AWS clients
-bedrock_agentcore = boto3.client('bedrock-agentcore', region_name=REGION)
+# Pull request actions that trigger an EcoCoder analysis
+_RELEVANT_ACTIONS = frozenset({'opened', 'synchronize', 'reopened'})
+
+# Prebuilt responses for the constant paths (CORS preflight, errors, health)
+_OPTIONS_RESPONSE = {
+    'statusCode': 200,
+    'headers': {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, X-GitHub-Event, X-Hub-Signature-256'
+    },
+    'body': ''
+}
+_METHOD_NOT_ALLOWED_RESPONSE = {
+    'statusCode': 405,
+    'headers': {'Content-Type': 'application/json'},
+    'body': _dumps({'error': 'Method not allowed. Use POST.'})
+}
+_NOT_GITHUB_WEBHOOK_RESPONSE = {
+    'statusCode': 400,
+    'headers': {'Content-Type': 'application/json'},
+    'body': _dumps({'error': 'Not a GitHub webhook'})
+}
+_INVALID_JSON_RESPONSE = {
+    'statusCode': 400,
+    'headers': {'Content-Type': 'application/json'},
+    'body': _dumps({'error': 'Invalid JSON payload'})
+}
+_INVALID_SIGNATURE_RESPONSE = {
+    'statusCode': 401,
+    'headers': {'Content-Type': 'application/json'},
+    'body': _dumps({'error': 'Invalid signature'})
+}
+_HEALTH_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+_HEALTH_TIMESTAMP_PLACEHOLDER = '"__TIMESTAMP__"'
+_HEALTH_BODY_TEMPLATE = _dumps({
+    'status': 'healthy',
+    'service': 'ecocoder-core-entry',
+    'version': '1.0.0',
+    'timestamp': '__TIMESTAMP__',  # swapped for the current time per request
+    'agent_arn': AGENT_ARN,
+    'region': REGION
+})
+
+# AWS clients (and boto3 itself) are loaded lazily so health checks, CORS
+# preflights and ignored events never pay for the boto3 import or client
+# construction.
+_client = None
+_lambda_client = None
+
+
+def _get_client():
+    """
+    Return the shared Bedrock AgentCore client, creating it on first use
+    """
+    global _client
+    if _client is None:
+        import boto3
+        _client = boto3.client('bedrock-agentcore', region_name=REGION)
+    return _client
 
 
-def verify_github_signature(payload_body: str, signature_header: str, secret: str) -> bool:
+def _get_lambda_client():
+    """
+    Return the shared Lambda client used for async self-invocation
+    """
+    global _lambda_client
+    if _lambda_client is None:
+        import boto3
+        _lambda_client = boto3.client('lambda', region_name=REGION)
+    return _lambda_client
+
+
+# Under SnapStart, build the clients (and load their service models) before the
+# snapshot is taken so restored environments start with them ready.
+try:
+    from snapshot_restore_py import register_before_snapshot
+except ImportError:  # Not running on a SnapStart-enabled Lambda runtime
+    register_before_snapshot = None
+
+if register_before_snapshot is not None:
+    @register_before_snapshot
+    def _prime_clients_for_snapshot():
+        _get_client()
+        _get_lambda_client()
+
+
+def verify_github_signature(payload_body: bytes, signature_header: str,
+                            secret: Union[bytes, str]) -> bool:
     """
     Verify GitHub webhook signature (optional for hackathon)
+    
+    payload_body must be the raw request bytes exactly as GitHub signed them.
     """
     if not secret or not signature_header:
         return True  # Skip verification if no secret configured
@@ -40,14 +156,15 @@ def verify_github_signature(payload_body: str, signature_header: str, secret: st
     if not signature_header.startswith('sha256='):
         return False
     
-    expected_signature = hmac.new(
-        secret.encode('utf-8'),
-        payload_body.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    try:
+        provided_signature = bytes.fromhex(signature_header[7:])  # Remove 'sha256=' prefix
+    except ValueError:
+        return False
     
-    signature = signature_header[7:]  # Remove 'sha256=' prefix
-    return hmac.compare_digest(expected_signature, signature)
+    if isinstance(secret, str):
+        secret = secret.encode('utf-8')
+    expected_signature = hmac.digest(secret, payload_body, 'sha256')
+    return hmac.compare_digest(expected_signature, provided_signature)
 
 
 def handle_async_agent_invocation(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -64,31 +181,35 @@ def handle_async_agent_invocation(event: Dict[str, Any]) -> Dict[str, Any]:
         logger.info(f"Processing async agent invocation for PR #{pr_number} in {repository}")
         
         # Prepare payload for AgentCore Runtime
-        agentcore_payload = json.dumps(github_payload).encode('utf-8')
+        agentcore_payload = _dumps_bytes(github_payload)
+        
+        # Reuse the prebuilt kwargs unless the event targets a different runtime
+        if agent_arn in (None, AGENT_ARN):
+            invoke_kwargs = _STATIC_INVOKE_KW
+        else:
+            invoke_kwargs = {**_STATIC_INVOKE_KW, 'agentRuntimeArn': agent_arn}
         
         # Invoke the AgentCore Runtime (this can take time, but it's async)
-        response = bedrock_agentcore.invoke_agent_runtime(
-            agentRuntimeArn=agent_arn,
+        response = _get_client().invoke_agent_runtime(
+            **invoke_kwargs,
             runtimeSessionId=session_id,
-            payload=agentcore_payload,
-            qualifier='DEFAULT'
+            payload=agentcore_payload
         )
         
-        # Process the streaming response
-        response_content = []
+        # Drain the streaming response, keeping only enough bytes for the log preview
+        preview = bytearray()
         for chunk in response.get('response', []):
-            if isinstance(chunk, bytes):
-                response_content.append(chunk.decode('utf-8'))
-            else:
-                response_content.append(str(chunk))
+            if len(preview) < 200:
+                preview.extend(chunk if isinstance(chunk, (bytes, bytearray)) else str(chunk).encode('utf-8'))
         
-        agent_response = ''.join(response_content)
-        logger.info(f"AgentCore Runtime completed for PR #{pr_number}: {agent_response[:200]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("AgentCore Runtime completed for PR #%s: %s...",
+                        pr_number, preview[:200].decode('utf-8', errors='replace'))
         
         # Return success (this won't be seen by GitHub webhook, but useful for CloudWatch)
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': _dumps({
                 'message': f'Agent analysis completed for PR #{pr_number}',
                 'session_id': session_id,
                 'repository': repository,
@@ -100,7 +221,7 @@ def handle_async_agent_invocation(event: Dict[str, Any]) -> Dict[str, Any]:
         logger.error(f"Async agent invocation failed for PR #{pr_number}: {str(e)}", exc_info=True)
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': _dumps({
                 'error': f'Agent analysis failed for PR #{pr_number}',
                 'message': str(e)
             })
@@ -110,10 +231,15 @@ def handle_async_agent_invocation(event: Dict[str, Any]) -> Dict[str, Any]:
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda function handler for GitHub webhook to AgentCore integration
-    Supports both webhook processing and async agent invocation
+    Supports webhook processing, async agent invocation and scheduled warmer pings
     """
+    # Scheduled keep-warm ping: return before any logging, parsing or boto3 work
+    if event.get('warmer') is True or event.get('source') == 'aws.events':
+        return {'statusCode': 200, 'body': 'warm'}
+    
     try:
-        logger.info(f"Received event: {json.dumps(event, default=str)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", json.dumps(event, default=str))
         
         # Check if this is an async agent invocation
         if event.get('action') == 'invoke_agent':
@@ -122,7 +248,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Extract request details for webhook processing
         http_method = event.get('requestContext', {}).get('http', {}).get('method', 
                                 event.get('httpMethod', 'GET'))
-        headers = event.get('headers', {})
+        # Lower-case header names once (HTTP API v2 already does; REST API does not)
+        headers = {k.lower(): v for k, v in (event.get('headers') or {}).items()}
         body = event.get('body', '')
         path = event.get('path', event.get('pathParameters', {}).get('proxy', '') if event.get('pathParameters') else '')
         
@@ -130,84 +257,56 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if path == '/health' or path == 'health':
             return {
                 'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'status': 'healthy',
-                    'service': 'ecocoder-core-entry',
-                    'version': '1.0.0',
-                    'timestamp': int(time.time()),
-                    'agent_arn': AGENT_ARN,
-                    'region': REGION
-                })
+                'headers': _HEALTH_HEADERS,
+                'body': _HEALTH_BODY_TEMPLATE.replace(
+                    _HEALTH_TIMESTAMP_PLACEHOLDER, str(int(time.time())), 1
+                )
             }
         
         # Handle preflight OPTIONS requests (CORS)
         if http_method == 'OPTIONS':
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-                    'Access-Control-Allow-Headers': 'Content-Type, X-GitHub-Event, X-Hub-Signature-256'
-                },
-                'body': ''
-            }
+            return _OPTIONS_RESPONSE
         
         # Only accept POST requests
         if http_method != 'POST':
-            return {
-                'statusCode': 405,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'error': 'Method not allowed. Use POST.'})
-            }
+            return _METHOD_NOT_ALLOWED_RESPONSE
         
         # Check if it's a GitHub webhook
-        github_event = headers.get('x-github-event', headers.get('X-GitHub-Event', ''))
+        github_event = headers.get('x-github-event', '')
         if not github_event:
             logger.warning("No GitHub event header found")
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'error': 'Not a GitHub webhook'})
-            }
+            return _NOT_GITHUB_WEBHOOK_RESPONSE
         
-        # Parse the GitHub payload
-        try:
-            if event.get('isBase64Encoded', False):
-                import base64
-                body = base64.b64decode(body).decode('utf-8')
-            
-            github_payload = json.loads(body)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON payload: {e}")
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'error': 'Invalid JSON payload'})
-            }
+        # Work on the raw body bytes; the body is never decoded back into a str
+        if event.get('isBase64Encoded', False):
+            import base64
+            raw_body = base64.b64decode(body)
+        else:
+            raw_body = body.encode('utf-8')
         
         # Optional: Verify GitHub signature (recommended for production)
         if GITHUB_SECRET:
-            signature = headers.get('x-hub-signature-256', headers.get('X-Hub-Signature-256', ''))
-            if not verify_github_signature(body, signature, GITHUB_SECRET):
+            signature = headers.get('x-hub-signature-256', '')
+            if not verify_github_signature(raw_body, signature, _GITHUB_SECRET_KEY):
                 logger.error("GitHub signature verification failed")
-                return {
-                    'statusCode': 401,
-                    'headers': {'Content-Type': 'application/json'},
-                    'body': json.dumps({'error': 'Invalid signature'})
-                }
+                return _INVALID_SIGNATURE_RESPONSE
         
         logger.info(f"Processing GitHub {github_event} event")
         
         # Filter for relevant events (pull request events)
         if github_event == 'pull_request':
+            # Only pull_request payloads are parsed; other events are ignored unread.
+            # Both orjson and json accept bytes directly.
+            try:
+                github_payload = _loads(raw_body)
+            except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
+                logger.error(f"Failed to parse JSON payload: {e}")
+                return _INVALID_JSON_RESPONSE
+            
             action = github_payload.get('action', '')
             
             # Only process relevant PR actions
-            if action in ['opened', 'synchronize', 'reopened']:
+            if action in _RELEVANT_ACTIONS:
                 logger.info(f"Processing pull_request {action} event")
                 
                 # Extract basic PR info for logging
@@ -216,14 +315,12 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 
                 try:
                     # Generate unique session ID for this webhook
-                    session_id = f"webhook-{repo_name}-{pr_number}-{uuid.uuid4().hex[:8]}"
+                    session_id = f"webhook-{repo_name}-{pr_number}-{os.urandom(4).hex()}"
                     
                     logger.info(f"Initiating async AgentCore Runtime analysis for PR #{pr_number} in {repo_name}")
                     
                     # Invoke the AgentCore Runtime asynchronously using Lambda invoke
                     # This creates a fire-and-forget pattern
-                    lambda_client = boto3.client('lambda', region_name=REGION)
-                    
                     async_payload = {
                         'action': 'invoke_agent',
                         'session_id': session_id,
@@ -233,23 +330,22 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         'pr_number': pr_number
                     }
                     
-                    # Invoke this same Lambda function asynchronously for agent processing
-                    lambda_client.invoke(
-                        FunctionName=os.environ.get('AWS_LAMBDA_FUNCTION_NAME'),
-                        InvocationType='Event',  # Asynchronous invocation
-                        Payload=json.dumps(async_payload)
+                    # Hand off to the worker (this function) asynchronously
+                    _get_lambda_client().invoke(
+                        Payload=_dumps(async_payload),
+                        **_WORKER_INVOKE_KW  # Asynchronous invocation
                     )
                     
                     logger.info(f"Async agent invocation queued for PR #{pr_number}")
                     
-                    # Return immediate response to GitHub
+                    # Return immediately to GitHub: accepted, processing continues in the worker
                     return {
-                        'statusCode': 200,
+                        'statusCode': 202,
                         'headers': {
                             'Content-Type': 'application/json',
                             'Access-Control-Allow-Origin': '*'
                         },
-                        'body': json.dumps({
+                        'body': _dumps({
                             'message': f'EcoCoder analysis queued for PR #{pr_number}',
                             'session_id': session_id,
                             'repository': repo_name,
@@ -267,7 +363,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                             'Content-Type': 'application/json',
                             'Access-Control-Allow-Origin': '*'
                         },
-                        'body': json.dumps({
+                        'body': _dumps({
                             'message': f'Failed to queue EcoCoder analysis for PR #{pr_number}',
                             'error': str(queue_error),
                             'status': 'error'
@@ -278,7 +374,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json'},
-                    'body': json.dumps({'message': f'Ignored pull_request {action} event'})
+                    'body': _dumps({'message': f'Ignored pull_request {action} event'})
                 }
         
         else:
@@ -286,7 +382,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return {
                 'statusCode': 200,
                 'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'message': f'Ignored {github_event} event'})
+                'body': _dumps({'message': f'Ignored {github_event} event'})
             }
     
     except Exception as e:
@@ -294,7 +390,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
+            'body': _dumps({
                 'error': 'Internal server error',
                 'message': str(e)
             })
@@ -13,17 +13,20 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    env_file = project_root / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
-        print(f"✅ Loaded environment from {env_file}")
-    else:
-        print(f"⚠️  No .env file found at {env_file}")
-except ImportError:
-    print("⚠️  python-dotenv not installed, using system environment")
+# Load environment variables from .env file once per process tree; already
+# exported variables win over the file (override=False)
+if 'ECOCODER_BOOTSTRAPPED' not in os.environ:
+    try:
+        from dotenv import load_dotenv
+        env_file = project_root / '.env'
+        if env_file.exists():
+            load_dotenv(env_file, override=False)
+            print(f"✅ Loaded environment from {env_file}")
+        else:
+            print(f"⚠️  No .env file found at {env_file}")
+    except ImportError:
+        print("⚠️  python-dotenv not installed, using system environment")
+    os.environ['ECOCODER_BOOTSTRAPPED'] = '1'
 
 # Set development environment
 os.environ['ENVIRONMENT'] = 'development'
@@ -51,27 +54,48 @@ def check_agent_server(host="localhost", port=8080, timeout=5):
         return False
 
 
-def wait_for_agent_server(host="localhost", port=8080, max_attempts=30):
-    """Wait for the agent server to be available"""
-    import time
-    
+def wait_for_agent_server(host="localhost", port=8080, timeout=30):
+    """Wait for the agent server to be available, polling with exponential backoff"""
     print(f"🔍 Checking if agent server is running at http://{host}:{port}...")
     
-    for attempt in range(max_attempts):
-        if check_agent_server(host, port):
+    delay = 0.05
+    start = time.monotonic()
+    deadline = start + timeout
+    next_progress = start + 5
+    announced = False
+    
+    while time.monotonic() < deadline:
+        # Localhost connects are immediate, so a short probe timeout is enough
+        if check_agent_server(host, port, timeout=0.2):
             print(f"✅ Agent server is available at http://{host}:{port}")
             return True
         
-        if attempt == 0:
+        now = time.monotonic()
+        if not announced:
             print(f"⏳ Waiting for agent server to start...")
-        elif attempt % 5 == 0:
-            print(f"⏳ Still waiting... (attempt {attempt + 1}/{max_attempts})")
+            announced = True
+        elif now >= next_progress:
+            print(f"⏳ Still waiting... ({now - start:.0f}s/{timeout}s)")
+            next_progress = now + 5
         
-        time.sleep(1)
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
     
     return False
 
 
+_session = None
+
+
+def _get_session():
+    """Return a shared requests.Session so repeated API calls reuse the connection"""
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+
 def call_agent_api(payload, host="localhost", port=8080):
     """Call the agent API via HTTP request"""
     import requests
@@ -82,7 +106,7 @@ def call_agent_api(payload, host="localhost", port=8080):
     
     try:
         print(f"🚀 Sending request to {url}")
-        response = requests.post(url, headers=headers, json=payload, timeout=120)
+        response = _get_session().post(url, headers=headers, json=payload, timeout=120)
         
         print(f"📡 Response Status: {response.status_code}")
         
@@ -8,6 +8,9 @@ import os
 # Add the project root to the path
 sys.path.insert(0, '/Users/ali/Source/EcoCoderAgentCore')
 
+# Cache the PR diff and LLM responses between runs; the PR head sha is fixed
+os.environ.setdefault('ECOCODER_REVIEW_CACHE_DIR', '/tmp/ecocoder_review_cache')
+
 from app.tools.llm_code_reviewer import analyze_code_quality_with_llm
 
 def test_llm_code_reviewer():
@@ -0,0 +1,105 @@
+"""
+Shared pytest configuration for the EcoCoder Agent tests
+"""
+
+import logging
+import os
+import sys
+import time
+from types import MappingProxyType
+
+import pytest
+
+# Add project root to path once for the whole test session
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Run the suite in mock mode. app.agent and the tool modules read these at
+# import (the tools pick mock or real implementations from ENVIRONMENT), so
+# they must be set before the import below.
+os.environ['ENABLE_AGENTCORE_MEMORY'] = 'false'
+os.environ['ENVIRONMENT'] = 'development'
+
+# Import the agent (and, through it, every tool module) once at collection
+# time; test modules then resolve it straight from sys.modules
+import app.agent
+
+
+# Minimal valid pull_request webhook payload. Read-only at the top level;
+# pass dict(...) to code that needs a real dict (e.g. invoke() serializes it).
+_VALID_WEBHOOK_PAYLOAD = MappingProxyType({
+    "action": "opened",
+    "pull_request": {
+        "number": 42,
+        "title": "feat: Add new feature",
+        "head": {
+            "ref": "feature/new-feature",
+            "sha": "abc123def456"
+        },
+        "base": {
+            "ref": "main"
+        }
+    },
+    "repository": {
+        "full_name": "owner/repo",
+        "clone_url": "https://github.com/owner/repo.git",
+        "owner": {
+            "id": "12345"
+        }
+    }
+})
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked slow (full agent invocations)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: long-running agent invoke, skipped without --runslow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture
+def info_logger():
+    """Opt-in INFO-level logging for tests that want to see agent log output"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    return logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="session")
+def session_suffix():
+    """Timestamp suffix computed once per run to keep session ids unique"""
+    return str(int(time.time()))
+
+
+@pytest.fixture
+def unique_session_id(request, session_suffix):
+    """Session id unique to the requesting test within this run"""
+    return f"{request.node.name}-{session_suffix}"
+
+
+@pytest.fixture(scope="session")
+def dev_agent():
+    """Development-mode agent built once and shared by tests that only inspect it"""
+    return app.agent.create_agent("test-session-shared", "test-owner/test-repo")
+
+
+@pytest.fixture(scope="session")
+def valid_webhook_payload():
+    """Read-only view of the minimal valid pull_request webhook payload"""
+    return _VALID_WEBHOOK_PAYLOAD
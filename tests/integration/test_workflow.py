@@ -5,43 +5,58 @@ Tests the full workflow from webhook to response
 
 import json
 import pytest
-import sys
-import os
-
-# Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+import time
 
 from app.agent import invoke
 
 
+def _base_pr_payload(pr_number, title, ref, sha, repo, owner_id, action="opened"):
+    """Build a fresh minimal GitHub pull_request webhook payload"""
+    return {
+        "action": action,
+        "pull_request": {
+            "number": pr_number,
+            "title": title,
+            "head": {"ref": ref, "sha": sha},
+            "base": {"ref": "main"}
+        },
+        "repository": {
+            "full_name": repo,
+            "clone_url": f"https://github.com/{repo}.git",
+            "owner": {"id": owner_id}
+        }
+    }
+
+
+# Canonical PR payload (same as in the main function), invoked once per module
+CANONICAL_PAYLOAD = _base_pr_payload(
+    42, "feat: Add new data processing algorithm",
+    "feature/optimize-performance", "a1b2c3d4e5f6",
+    "eco-tech/sample-app", "123456"
+)
+
+
+@pytest.fixture(scope="module")
+def canonical_invoke_timing():
+    """Invoke the agent once with the canonical payload, timing the call"""
+    start_time = time.time()
+    result = invoke(CANONICAL_PAYLOAD)
+    return result, time.time() - start_time
+
+
+@pytest.fixture(scope="module")
+def canonical_invoke_result(canonical_invoke_timing):
+    """Shared result of the canonical invocation for read-only assertions"""
+    return canonical_invoke_timing[0]
+
+
 class TestFullWorkflow:
     """Test complete end-to-end workflow"""
     
-    def test_full_webhook_processing(self):
+    @pytest.mark.slow
+    def test_full_webhook_processing(self, canonical_invoke_result):
         """Test processing a complete GitHub webhook"""
-        # Use the same test payload as in the main function
-        payload = {
-            "action": "opened",
-            "pull_request": {
-                "number": 42,
-                "title": "feat: Add new data processing algorithm",
-                "head": {
-                    "ref": "feature/optimize-performance", 
-                    "sha": "a1b2c3d4e5f6"
-                },
-                "base": {"ref": "main"}
-            },
-            "repository": {
-                "full_name": "eco-tech/sample-app",
-                "clone_url": "https://github.com/eco-tech/sample-app.git",
-                "owner": {"id": "123456"}
-            }
-        }
-        
-        # Set mock mode for testing
-        os.environ['ENABLE_AGENTCORE_MEMORY'] = 'false'
-        
-        result = invoke(payload)
+        result = canonical_invoke_result
         
         # Verify response structure
         assert isinstance(result, dict)
@@ -69,34 +84,19 @@ class TestFullWorkflow:
         assert exec_time >= 0
         assert exec_time < 120  # Should complete within 120 seconds
     
-    def test_different_pr_actions(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("action", ["opened", "synchronize", "reopened"])
+    def test_pr_action(self, action):
         """Test different GitHub PR actions"""
-        actions = ["opened", "synchronize", "reopened"]
+        payload = _base_pr_payload(
+            123, f"Test PR for {action}", "test-branch", f"sha-{action}",
+            "test/repo", "456", action=action
+        )
         
-        for action in actions:
-            payload = {
-                "action": action,
-                "pull_request": {
-                    "number": 123,
-                    "title": f"Test PR for {action}",
-                    "head": {
-                        "ref": "test-branch", 
-                        "sha": f"sha-{action}"
-                    },
-                    "base": {"ref": "main"}
-                },
-                "repository": {
-                    "full_name": "test/repo",
-                    "clone_url": "https://github.com/test/repo.git",
-                    "owner": {"id": "456"}
-                }
-            }
-            
-            os.environ['ENABLE_AGENTCORE_MEMORY'] = 'false'
-            result = invoke(payload)
-            
-            assert result["status"] == "success"
-            assert result["pr_info"]["action"] == action
+        result = invoke(payload)
+        
+        assert result["status"] == "success"
+        assert result["pr_info"]["action"] == action
     
     def test_error_handling(self):
         """Test error handling for various failure scenarios"""
@@ -139,31 +139,11 @@ class TestFullWorkflow:
 class TestPerformance:
     """Test performance characteristics"""
     
-    def test_response_time(self):
+    @pytest.mark.slow
+    def test_response_time(self, canonical_invoke_timing):
         """Test that responses are generated within reasonable time"""
-        payload = {
-            "action": "opened",
-            "pull_request": {
-                "number": 999,
-                "title": "Performance test PR",
-                "head": {"ref": "perf-test", "sha": "perfsha123"},
-                "base": {"ref": "main"}
-            },
-            "repository": {
-                "full_name": "perf/test",
-                "clone_url": "https://github.com/perf/test.git",
-                "owner": {"id": "789"}
-            }
-        }
-        
-        os.environ['ENABLE_AGENTCORE_MEMORY'] = 'false'
-        
-        import time
-        start_time = time.time()
-        result = invoke(payload)
-        end_time = time.time()
-        
-        execution_time = end_time - start_time
+        # The shared canonical invocation is uncached and timed around the call
+        result, execution_time = canonical_invoke_timing
         
         assert result["status"] == "success"
         assert execution_time < 180.0  # Should complete within 180 seconds in mock mode
@@ -180,26 +160,14 @@ class TestComprehensiveScenarios:
     """Test comprehensive scenarios"""
 
     @pytest.mark.parametrize("scenario, payload, expected_status", [
-        (
+        pytest.param(
             "Standard PR Opened",
-            {
-                "action": "opened",
-                "pull_request": {
-                    "number": 123,
-                    "title": "feat: Add new authentication system",
-                    "head": {
-                        "ref": "feature/auth-system",
-                        "sha": "abc123def456"
-                    },
-                    "base": {"ref": "main"}
-                },
-                "repository": {
-                    "full_name": "company/backend-service",
-                    "clone_url": "https://github.com/company/backend-service.git",
-                    "owner": {"id": "12345"}
-                }
-            },
-            "success"
+            _base_pr_payload(
+                123, "feat: Add new authentication system", "feature/auth-system",
+                "abc123def456", "company/backend-service", "12345"
+            ),
+            "success",
+            marks=pytest.mark.slow
         ),
         (
             "Invalid Payload",
@@ -229,7 +197,6 @@ class TestComprehensiveScenarios:
     ])
     def test_scenario(self, scenario, payload, expected_status):
         """Test a specific scenario"""
-        os.environ['ENABLE_AGENTCORE_MEMORY'] = 'false'
         result = invoke(payload)
         assert result['status'] == expected_status
 
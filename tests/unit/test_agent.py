@@ -5,106 +5,100 @@ Unit tests for the EcoCoder Agent main functionality
 import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
-
-# Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from app.agent import (
     parse_github_webhook,
-    create_agent,
+    get_session_manager,
     invoke,
     load_system_prompt
 )
 
 
+# Tools create_agent must register
+_EXPECTED_TOOLS = frozenset({
+    'analyze_code',
+    'profile_code_performance_tool',
+    'calculate_carbon_footprint_tool',
+    'post_github_comment_tool'
+})
+
+# Sample arguments for calling each registered tool directly
+_TOOL_CALLS = [
+    ("analyze_code", {
+        "repository_arn": "arn:aws:codecommit:us-east-1:123456:test-repo",
+        "branch_name": "main",
+        "commit_sha": "abc123"
+    }),
+    ("profile_code_performance_tool", {
+        "profiling_group_name": "test-group",
+        "start_time": "2023-01-01T00:00:00Z",
+        "end_time": "2023-01-01T01:00:00Z"
+    }),
+    ("calculate_carbon_footprint_tool", {
+        "cpu_time_seconds": 10.5,
+        "ram_usage_mb": 512.0,
+        "aws_region": "us-east-1",
+        "execution_count": 100
+    }),
+    ("post_github_comment_tool", {
+        "repository_full_name": "owner/repo",
+        "pull_request_number": 42,
+        "report_markdown": "# Test Report\nThis is a test."
+    }),
+]
+
+
 class TestGitHubWebhookParsing:
     """Test GitHub webhook payload parsing"""
     
-    def test_parse_valid_github_webhook(self):
+    def test_parse_valid_github_webhook(self, valid_webhook_payload):
         """Test parsing a valid GitHub webhook payload"""
-        payload = {
+        expected = {
             "action": "opened",
-            "pull_request": {
-                "number": 42,
-                "title": "feat: Add new feature",
-                "head": {
-                    "ref": "feature/new-feature",
-                    "sha": "abc123def456"
-                },
-                "base": {
-                    "ref": "main"
-                }
-            },
-            "repository": {
-                "full_name": "owner/repo",
-                "clone_url": "https://github.com/owner/repo.git",
-                "owner": {
-                    "id": "12345"
-                }
-            }
+            "pr_number": 42,
+            "repository_name": "owner/repo",
+            "commit_sha": "abc123def456",
+            "branch_name": "feature/new-feature",
+            "base_branch": "main",
+            "title": "feat: Add new feature"
         }
         
-        result = parse_github_webhook(payload)
+        result = parse_github_webhook(valid_webhook_payload)
         
-        assert result["action"] == "opened"
-        assert result["pr_number"] == 42
-        assert result["repository_name"] == "owner/repo"
-        assert result["commit_sha"] == "abc123def456"
-        assert result["branch_name"] == "feature/new-feature"
-        assert result["base_branch"] == "main"
-        assert result["title"] == "feat: Add new feature"
+        assert expected.items() <= result.items()
     
-    def test_parse_invalid_github_webhook(self):
-        """Test parsing an invalid GitHub webhook payload"""
-        payload = {"invalid": "data"}
-        
-        # The function doesn't raise ValueError for invalid data, it returns None values
+    @pytest.mark.parametrize("payload, expected", [
+        (
+            # Invalid data doesn't raise ValueError, it yields None values
+            {"invalid": "data"},
+            {"action": None, "pr_number": None, "repository_name": None}
+        ),
+        (
+            {"action": "opened", "pull_request": {}, "repository": {}},
+            {"pr_number": None, "repository_name": None}
+        )
+    ], ids=["invalid", "missing_fields"])
+    def test_parse_incomplete_github_webhook(self, payload, expected):
+        """Test parsing webhook payloads that lack the PR fields"""
         result = parse_github_webhook(payload)
-        assert result["action"] is None
-        assert result["pr_number"] is None
-        assert result["repository_name"] is None
-    
-    def test_parse_missing_fields(self):
-        """Test parsing webhook with missing required fields"""
-        payload = {
-            "action": "opened",
-            "pull_request": {},
-            "repository": {}
-        }
         
-        result = parse_github_webhook(payload)
-        assert result["pr_number"] is None
-        assert result["repository_name"] is None
+        assert expected.items() <= result.items()
 
 
 class TestAgentCreation:
     """Test agent creation and configuration"""
     
-    @patch.dict(os.environ, {'ENVIRONMENT': 'development'})
-    def test_create_agent_development_mode(self):
+    def test_create_agent_development_mode(self, dev_agent):
         """Test creating agent in development mode"""
-        session_id = "test-session-123"
-        repository = "test-owner/test-repo"
-        
-        agent = create_agent(session_id, repository)
+        agent = dev_agent
         
         assert agent is not None
-        assert hasattr(agent, 'tool_registry')
-        assert hasattr(agent, 'tool_names')
+        assert getattr(agent, 'tool_registry', None) is not None
+        assert getattr(agent, 'tool_names', None) is not None
         assert len(agent.tool_names) > 0
         
         # Check that required tools are registered
-        expected_tools = [
-            'analyze_code',
-            'profile_code_performance_tool',
-            'calculate_carbon_footprint_tool',
-            'post_github_comment_tool'
-        ]
-        
-        for tool_name in expected_tools:
-            assert tool_name in agent.tool_names
+        assert _EXPECTED_TOOLS <= set(agent.tool_names)
 
     def test_load_system_prompt(self):
         """Test loading system prompt"""
@@ -115,54 +109,57 @@ class TestAgentCreation:
         assert "Eco-Coder" in prompt
 
 
+@pytest.mark.usefixtures("info_logger")
+class TestSessionManager:
+    """Test session manager initialization"""
+    
+    def test_session_manager_initialization(self, unique_session_id):
+        """Test session manager initialization"""
+        # Test parameters
+        actor_id = "test-repo"
+        
+        # Test session manager creation
+        session_manager = get_session_manager(actor_id, unique_session_id)
+        
+        if session_manager is None:
+            # This is acceptable as a fallback
+            assert session_manager is None
+        else:
+            assert session_manager is not None
+    
+    def test_agent_creation_with_session_manager(self, dev_agent):
+        """Test agent creation with session manager"""
+        agent = dev_agent
+        
+        assert agent is not None
+        assert getattr(agent, 'tool_registry', None) is not None
+
+
 class TestMainInvoke:
     """Test the main invoke function"""
     
-    @patch.dict(os.environ, {'ENVIRONMENT': 'development'})
-    def test_invoke_success(self):
+    @pytest.mark.slow
+    def test_invoke_success(self, valid_webhook_payload):
         """Test successful invocation with valid payload"""
-        payload = {
-            "action": "opened",
-            "pull_request": {
-                "number": 42,
-                "title": "feat: Add new feature",
-                "head": {
-                    "ref": "feature/new-feature",
-                    "sha": "abc123def456"
-                },
-                "base": {
-                    "ref": "main"
-                }
-            },
-            "repository": {
-                "full_name": "owner/repo",
-                "clone_url": "https://github.com/owner/repo.git",
-                "owner": {
-                    "id": "12345"
-                }
-            }
-        }
-        
-        result = invoke(payload)
+        result = invoke(dict(valid_webhook_payload))
         
         assert result["status"] == "success"
-        assert "session_id" in result
-        assert "agent_response" in result
-        assert "execution_time_seconds" in result
-        assert "pr_info" in result
+        assert {"session_id", "agent_response", "execution_time_seconds", "pr_info"} <= result.keys()
     
-    @patch.dict(os.environ, {'ENVIRONMENT': 'development'})
     def test_invoke_invalid_payload(self):
         """Test invocation with invalid payload"""
         payload = {"invalid": "data"}
         
-        result = invoke(payload)
+        with patch("app.agent.agent") as mock_agent, \
+             patch("app.agent.parse_github_webhook") as mock_parse:
+            result = invoke(payload)
         
+        # Rejected by the up-front validation, before parsing or agent work
+        mock_parse.assert_not_called()
+        mock_agent.assert_not_called()
         assert result["status"] == "error"
-        assert "message" in result
-        assert "execution_time_seconds" in result
+        assert {"message", "execution_time_seconds"} <= result.keys()
     
-    @patch.dict(os.environ, {'ENVIRONMENT': 'development'})  
     def test_invoke_missing_pr_info(self):
         """Test invocation with missing PR information"""
         payload = {
@@ -175,6 +172,29 @@ class TestMainInvoke:
             }
         }
         
+        # With no agent, only validation running first yields the PR info error
+        # rather than "Agent initialization failed"
+        with patch("app.agent.agent", None):
+            result = invoke(payload)
+        
+        assert result["status"] == "error"
+        assert result["session_id"] == "unknown"
+        assert "Missing required PR information" in result["message"]
+
+
+    @pytest.mark.parametrize("payload", [
+        {"pull_request": "x"},
+        {
+            "pull_request": {"number": 1, "head": "abc"},
+            "repository": {"full_name": "owner/repo"}
+        },
+        {
+            "pull_request": {"number": 1, "head": {"ref": "branch", "sha": "sha123"}},
+            "repository": ["owner/repo"]
+        }
+    ], ids=["pull_request_str", "head_str", "repository_list"])
+    def test_invoke_malformed_payload_types(self, payload):
+        """Test invocation with non-dict PR, head or repository values"""
         result = invoke(payload)
         
         assert result["status"] == "error"
@@ -184,52 +204,11 @@ class TestMainInvoke:
 class TestToolIntegration:
     """Test tool integration functionality"""
     
-    @patch.dict(os.environ, {'ENVIRONMENT': 'development'})
-    def test_tools_are_callable(self):
-        """Test that all tools can be called without errors"""
-        session_id = "test-session-123"
-        repository = "test-owner/test-repo"
-        
-        agent = create_agent(session_id, repository)
-        
-        # Get tools from the registry
-        tools = agent.tool_registry.registry
-        
-        # Test analyze_code tool
-        analyze_code = tools['analyze_code']
-        result = analyze_code(
-            repository_arn="arn:aws:codecommit:us-east-1:123456:test-repo",
-            branch_name="main",
-            commit_sha="abc123"
-        )
-        assert isinstance(result, dict)
-        
-        # Test profile_code_performance_tool
-        profile_tool = tools['profile_code_performance_tool']
-        result = profile_tool(
-            profiling_group_name="test-group",
-            start_time="2023-01-01T00:00:00Z",
-            end_time="2023-01-01T01:00:00Z"
-        )
-        assert isinstance(result, dict)
-        
-        # Test calculate_carbon_footprint_tool
-        carbon_tool = tools['calculate_carbon_footprint_tool']
-        result = carbon_tool(
-            cpu_time_seconds=10.5,
-            ram_usage_mb=512.0,
-            aws_region="us-east-1",
-            execution_count=100
-        )
-        assert isinstance(result, dict)
+    @pytest.mark.parametrize("tool_name, kwargs", _TOOL_CALLS, ids=[name for name, _ in _TOOL_CALLS])
+    def test_tools_are_callable(self, dev_agent, tool_name, kwargs):
+        """Test that each tool can be called without errors"""
+        result = dev_agent.tool_registry.registry[tool_name](**kwargs)
         
-        # Test post_github_comment_tool
-        github_tool = tools['post_github_comment_tool']
-        result = github_tool(
-            repository_full_name="owner/repo",
-            pull_request_number=42,
-            report_markdown="# Test Report\nThis is a test."
-        )
         assert isinstance(result, dict)
 
 